@@ -1,264 +1,528 @@
 #!/usr/bin/env python3
 import asyncio
+import atexit
+import concurrent.futures
+import functools
 import json
+import socket
+import sys
+from collections import OrderedDict, UserDict, deque
+from typing import Awaitable, Callable
 from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 import mcp.types as types
 import roslibpy
+from jsonschema import Draft202012Validator, ValidationError
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib encoder
+    orjson = None
 
 # Connect to ROS in your Ubuntu VM
 ros = roslibpy.Ros(host='192.168.64.2', port=9090)
 
 app = Server("ros-mcp-server")
 
-@app.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    return [
-        types.Tool(
-            name="list_topics",
-            description="List all available ROS topics",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        types.Tool(
-            name="get_topic_info",
-            description="Get information about a specific ROS topic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic_name": {
-                        "type": "string",
-                        "description": "Name of the ROS topic"
-                    }
-                },
-                "required": ["topic_name"]
-            }
-        ),
-        types.Tool(
-            name="publish_message",
-            description="Publish a message to a ROS topic",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic_name": {"type": "string"},
-                    "message_type": {"type": "string"},
-                    "message_data": {"type": "object"}
-                },
-                "required": ["topic_name", "message_type", "message_data"]
-            }
-        ),
-        types.Tool(
-            name="list_nodes",
-            description="List all available ROS nodes",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        types.Tool(
-            name="get_node_info",
-            description="Get information about a specific ROS node",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_name": {
-                        "type": "string",
-                        "description": "Name of the ROS node"
-                    }
-                },
-                "required": ["node_name"]
-            }
-        ),
-        types.Tool(
-            name="list_services",
-            description="List all available ROS services",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        types.Tool(
-            name="get_service_info",
-            description="Get information about a specific ROS service",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "service_name": {
-                        "type": "string",
-                        "description": "Name of the ROS service"
-                    }
-                },
-                "required": ["service_name"]
-            }
-        ),
-        types.Tool(
-            name="call_service",
-            description="Call a ROS service",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "service_name": {"type": "string"},
-                    "service_type": {"type": "string"},
-                    "service_args": {"type": "object"}
-                },
-                "required": ["service_name", "service_type", "service_args"]
-            }
-        ),
-        types.Tool(
-            name="get_param",
-            description="Get a ROS parameter value",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "param_name": {
-                        "type": "string",
-                        "description": "Name of the ROS parameter"
-                    }
-                },
-                "required": ["param_name"]
-            }
-        ),
-        types.Tool(
-            name="set_param",
-            description="Set a ROS parameter value",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "param_name": {"type": "string"},
-                    "param_value": {"type": "string"}
+# Upper bound on any single rosbridge round-trip, so a stuck rosbridge can't hang a tool call
+DEFAULT_TIMEOUT = 10.0
+
+async def _run(aw):
+    try:
+        return await asyncio.wait_for(aw, DEFAULT_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise asyncio.TimeoutError(f"no reply from rosbridge within {DEFAULT_TIMEOUT}s") from None
+
+# The few roslibpy calls with no callback form (publishing, the initial connect) run here,
+# off the event loop. ROS reads use _await_ros so a stuck rosbridge can't pin a worker.
+_EXEC = concurrent.futures.ThreadPoolExecutor(max_workers=16)
+
+async def _run_blocking(fn, *args):
+    loop = asyncio.get_running_loop()
+    return await _run(loop.run_in_executor(_EXEC, functools.partial(fn, *args)))
+
+# Bound in-flight tool calls so a noisy client can't flood rosbridge. Subscriptions
+# hold a rosbridge subscription open for up to their timeout, so they are gated
+# separately with a tighter cap instead of tying up slots in the global one.
+_SEM = asyncio.Semaphore(16)
+_SUBSCRIBE_SEM = asyncio.Semaphore(4)
+
+def _settle(fut, result=None, error=None):
+    # rosbridge may answer after the awaiting task was cancelled
+    if fut.done():
+        return
+    if error is not None:
+        fut.set_exception(error)
+    else:
+        fut.set_result(result)
+
+async def _await_ros(fn, *args):
+    # Call a roslibpy method in its (callback, errback) form and await the reply.
+    # The callbacks fire on roslibpy's network thread, so hop back onto the loop.
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+    fn(
+        *args,
+        lambda result: loop.call_soon_threadsafe(_settle, fut, result),
+        lambda error: loop.call_soon_threadsafe(_settle, fut, None, RuntimeError(error)),
+    )
+    return await _run(fut)
+
+async def _call_service_async(service, request):
+    return await _await_ros(service.call, request)
+
+async def _rosapi(fn, key, *args):
+    # In callback form the rosapi getters hand over the raw service response, not the field
+    result = await _await_ros(fn, *args)
+    return result[key]
+
+# Graph queries change slowly relative to client polling, so briefly reuse their results
+_CACHE_TTL = 0.5
+_CACHE: dict[tuple, tuple[float, asyncio.Task]] = {}
+
+async def _cached(key: tuple, ttl: float, coro_factory):
+    # Entries hold the fetch task itself, so concurrent callers share one in-flight
+    # request. Pending entries never expire; the TTL starts once the fetch succeeds.
+    loop = asyncio.get_running_loop()
+    now = loop.time()
+    entry = _CACHE.get(key)
+    if entry is not None and entry[0] > now:
+        return await asyncio.shield(entry[1])
+
+    # Keys include client-supplied names, so drop expired entries as new ones are added
+    for stale in [k for k, (expires, _) in _CACHE.items() if expires <= now]:
+        del _CACHE[stale]
+
+    task = loop.create_task(coro_factory())
+    _CACHE[key] = (float("inf"), task)
+
+    def on_done(t):
+        if _CACHE.get(key, (None, None))[1] is not t:
+            return
+        if t.cancelled() or t.exception() is not None:
+            del _CACHE[key]
+        else:
+            _CACHE[key] = (loop.time() + ttl, t)
+
+    task.add_done_callback(on_done)
+    # Shield so one caller being cancelled doesn't cancel the fetch other callers await
+    return await asyncio.shield(task)
+
+def _json_default(obj):
+    # roslibpy messages and service responses are UserDicts, which neither encoder handles
+    if isinstance(obj, UserDict):
+        return obj.data
+    return str(obj)
+
+def _dumps(obj) -> str:
+    # Compact JSON is cheaper to build than repr() of large nested lists/dicts
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(",", ":"), default=_json_default)
+
+# Advertised publishers, reused so repeated publishes skip the advertise round-trip.
+# Keys come from clients and each entry holds an advertisement open on rosbridge, so
+# keep only the most recently used ones and unadvertise the rest.
+_MAX_PUBLISHERS = 32
+_PUBLISHERS: OrderedDict[tuple[str, str], roslibpy.Topic] = OrderedDict()
+
+def _publisher(topic_name: str, message_type: str) -> roslibpy.Topic:
+    key = (topic_name, message_type)
+    publisher = _PUBLISHERS.get(key)
+    if publisher is not None:
+        _PUBLISHERS.move_to_end(key)
+        return publisher
+    publisher = roslibpy.Topic(ros, topic_name, message_type)
+    publisher.advertise()
+    _PUBLISHERS[key] = publisher
+    if len(_PUBLISHERS) > _MAX_PUBLISHERS:
+        _, evicted = _PUBLISHERS.popitem(last=False)
+        try:
+            evicted.unadvertise()
+        except Exception:
+            pass
+    return publisher
+
+@atexit.register
+def _unadvertise_publishers():
+    for publisher in _PUBLISHERS.values():
+        try:
+            publisher.unadvertise()
+        except Exception:
+            pass
+    _PUBLISHERS.clear()
+
+# Tool schemas are static, so build them once at import time
+_TOOLS: list[types.Tool] = [
+    types.Tool(
+        name="list_topics",
+        description="List all available ROS topics",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_topic_info",
+        description="Get information about a specific ROS topic",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic_name": {
+                    "type": "string",
+                    "description": "Name of the ROS topic"
+                }
+            },
+            "required": ["topic_name"]
+        }
+    ),
+    types.Tool(
+        name="publish_message",
+        description="Publish a message to a ROS topic",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic_name": {"type": "string"},
+                "message_type": {"type": "string"},
+                "message_data": {"type": "object"}
+            },
+            "required": ["topic_name", "message_type", "message_data"]
+        }
+    ),
+    types.Tool(
+        name="list_nodes",
+        description="List all available ROS nodes",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_node_info",
+        description="Get information about a specific ROS node",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "node_name": {
+                    "type": "string",
+                    "description": "Name of the ROS node"
+                }
+            },
+            "required": ["node_name"]
+        }
+    ),
+    types.Tool(
+        name="list_services",
+        description="List all available ROS services",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_service_info",
+        description="Get information about a specific ROS service",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "service_name": {
+                    "type": "string",
+                    "description": "Name of the ROS service"
+                }
+            },
+            "required": ["service_name"]
+        }
+    ),
+    types.Tool(
+        name="call_service",
+        description="Call a ROS service",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "service_name": {"type": "string"},
+                "service_type": {"type": "string"},
+                "service_args": {"type": "object"}
+            },
+            "required": ["service_name", "service_type", "service_args"]
+        }
+    ),
+    types.Tool(
+        name="get_param",
+        description="Get a ROS parameter value",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "param_name": {
+                    "type": "string",
+                    "description": "Name of the ROS parameter"
+                }
+            },
+            "required": ["param_name"]
+        }
+    ),
+    types.Tool(
+        name="set_param",
+        description="Set a ROS parameter value",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "param_name": {"type": "string"},
+                "param_value": {
+                    "type": "string",
+                    "description": "Parameter value, parsed as JSON when possible (e.g. 3, 0.5, true, [1, 2]); otherwise set as a plain string"
+                }
+            },
+            "required": ["param_name", "param_value"]
+        }
+    ),
+    types.Tool(
+        name="list_params",
+        description="List all available ROS parameters",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="list_all",
+        description="List all available ROS topics, nodes, services and parameters in one call",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="subscribe_topic",
+        description="Subscribe to a ROS topic and get recent messages",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic_name": {
+                    "type": "string",
+                    "description": "Name of the ROS topic"
                 },
-                "required": ["param_name", "param_value"]
-            }
-        ),
-        types.Tool(
-            name="list_params",
-            description="List all available ROS parameters",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        types.Tool(
-            name="subscribe_topic",
-            description="Subscribe to a ROS topic and get recent messages",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic_name": {
-                        "type": "string",
-                        "description": "Name of the ROS topic"
-                    },
-                    "timeout": {
-                        "type": "number",
-                        "description": "Timeout in seconds to listen for messages",
-                        "default": 5.0
-                    }
+                "timeout": {
+                    "type": "number",
+                    "description": "Timeout in seconds to listen for messages",
+                    "default": 5.0,
+                    "minimum": 0,
+                    "maximum": 60
                 },
-                "required": ["topic_name"]
-            }
-        )
-    ]
+                "min_messages": {
+                    "type": "integer",
+                    "description": "Return as soon as this many messages have been received",
+                    "default": 1,
+                    "minimum": 1
+                }
+            },
+            "required": ["topic_name"]
+        }
+    )
+]
+
+# Argument validators are built once per tool rather than on every call
+_VALIDATORS = {tool.name: Draft202012Validator(tool.inputSchema) for tool in _TOOLS}
 
-@app.call_tool()
+@app.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    return _TOOLS
+
+async def _list_topics(arguments: dict) -> list[types.TextContent]:
+    topics = await _cached(("topics",), _CACHE_TTL, lambda: _rosapi(ros.get_topics, "topics"))
+    return [types.TextContent(type="text", text="Available topics:\n" + _dumps(topics))]
+
+async def _get_topic_info(arguments: dict) -> list[types.TextContent]:
+    topic_name = arguments["topic_name"]
+    topic_type = await _cached(
+        ("topic_type", topic_name), _CACHE_TTL, lambda: _rosapi(ros.get_topic_type, "type", topic_name)
+    )
+    return [types.TextContent(type="text", text=f"Topic {topic_name} type: {topic_type}")]
+
+async def _publish_message(arguments: dict) -> list[types.TextContent]:
+    topic_name = arguments["topic_name"]
+    message_type = arguments["message_type"]
+    message_data = arguments["message_data"]
+
+    publisher = _publisher(topic_name, message_type)
+    await _run_blocking(publisher.publish, roslibpy.Message(message_data))
+    return [types.TextContent(type="text", text=f"Published message to {topic_name}")]
+
+async def _list_nodes(arguments: dict) -> list[types.TextContent]:
+    nodes = await _cached(("nodes",), _CACHE_TTL, lambda: _rosapi(ros.get_nodes, "nodes"))
+    return [types.TextContent(type="text", text="Available nodes:\n" + _dumps(nodes))]
+
+async def _get_node_info(arguments: dict) -> list[types.TextContent]:
+    node_name = arguments["node_name"]
+    # rosapi returns publications, subscriptions and services in a single reply
+    service = roslibpy.Service(ros, "/rosapi/node_details", "rosapi/NodeDetails")
+    result = await _call_service_async(service, roslibpy.ServiceRequest({"node": node_name}))
+    node_details = {
+        "publishing": result.get("publishing", []),
+        "subscribing": result.get("subscribing", []),
+        "services": result.get("services", []),
+    }
+    return [types.TextContent(type="text", text=f"Node {node_name} details:\n" + _dumps(node_details))]
+
+async def _list_services(arguments: dict) -> list[types.TextContent]:
+    services = await _cached(("services",), _CACHE_TTL, lambda: _rosapi(ros.get_services, "services"))
+    return [types.TextContent(type="text", text="Available services:\n" + _dumps(services))]
+
+async def _get_service_info(arguments: dict) -> list[types.TextContent]:
+    service_name = arguments["service_name"]
+    service_type = await _cached(
+        ("service_type", service_name), _CACHE_TTL, lambda: _rosapi(ros.get_service_type, "type", service_name)
+    )
+    return [types.TextContent(type="text", text=f"Service {service_name} type: {service_type}")]
+
+async def _call_service(arguments: dict) -> list[types.TextContent]:
+    service_name = arguments["service_name"]
+    service_type = arguments["service_type"]
+    service_args = arguments["service_args"]
+
+    service = roslibpy.Service(ros, service_name, service_type)
+    request = roslibpy.ServiceRequest(service_args)
+    result = await _call_service_async(service, request)
+    return [types.TextContent(type="text", text="Service call result:\n" + _dumps(result))]
+
+async def _get_param(arguments: dict) -> list[types.TextContent]:
+    param_name = arguments["param_name"]
+    param = roslibpy.Param(ros, param_name)
+    value = await _await_ros(param.get)
+    return [types.TextContent(type="text", text=f"Parameter {param_name} value: {value}")]
+
+async def _set_param(arguments: dict) -> list[types.TextContent]:
+    param_name = arguments["param_name"]
+    param_value = arguments["param_value"]
+    # ROS params are typed, so send numbers, bools and lists as such rather than as strings
+    try:
+        value = json.loads(param_value)
+    except ValueError:
+        value = param_value
+    param = roslibpy.Param(ros, param_name)
+    await _await_ros(param.set, value)
+    # A new parameter name would otherwise be missing from list_params until the TTL expires
+    _CACHE.pop(("params",), None)
+    return [types.TextContent(type="text", text=f"Set parameter {param_name} to {param_value}")]
+
+async def _list_params(arguments: dict) -> list[types.TextContent]:
+    params = await _cached(("params",), _CACHE_TTL, lambda: _rosapi(ros.get_params, "names"))
+    return [types.TextContent(type="text", text="Available parameters:\n" + _dumps(params))]
+
+async def _list_all(arguments: dict) -> list[types.TextContent]:
+    # Issue the four rosapi queries concurrently; one failing doesn't lose the others
+    results = await asyncio.gather(
+        _cached(("topics",), _CACHE_TTL, lambda: _rosapi(ros.get_topics, "topics")),
+        _cached(("nodes",), _CACHE_TTL, lambda: _rosapi(ros.get_nodes, "nodes")),
+        _cached(("services",), _CACHE_TTL, lambda: _rosapi(ros.get_services, "services")),
+        _cached(("params",), _CACHE_TTL, lambda: _rosapi(ros.get_params, "names")),
+        return_exceptions=True,
+    )
+    keys = ("topics", "nodes", "services", "params")
+    combined = {
+        key: {"error": str(result)} if isinstance(result, Exception) else result
+        for key, result in zip(keys, results)
+    }
+    return [types.TextContent(type="text", text=_dumps(combined))]
+
+async def _subscribe_topic(arguments: dict) -> list[types.TextContent]:
+    topic_name = arguments["topic_name"]
+    timeout = arguments.get("timeout", 5.0)
+    min_messages = arguments.get("min_messages", 1)
+
+    # Only the most recent messages are reported, so don't retain the rest
+    messages = deque(maxlen=5)
+    count = 0
+    listener = roslibpy.Topic(ros, topic_name)
+    loop = asyncio.get_running_loop()
+    received = asyncio.Event()
+
+    def message_callback(message):
+        nonlocal count
+        count += 1
+        messages.append(message)
+        if count == min_messages:
+            loop.call_soon_threadsafe(received.set)
+
+    listener.subscribe(message_callback)
+
+    # Wait until enough messages have arrived or the timeout expires. Always
+    # unsubscribe, including when the client cancels the call mid-wait.
+    try:
+        await asyncio.wait_for(received.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        listener.unsubscribe()
+
+    if messages:
+        return [types.TextContent(type="text", text=f"Received {count} messages from {topic_name}, last {len(messages)}:\n" + _dumps(list(messages)))]
+    else:
+        return [types.TextContent(type="text", text=f"No messages received from {topic_name} within {timeout} seconds")]
+
+_HANDLERS: dict[str, Callable[[dict], Awaitable[list[types.TextContent]]]] = {
+    "list_topics": _list_topics,
+    "get_topic_info": _get_topic_info,
+    "publish_message": _publish_message,
+    "list_nodes": _list_nodes,
+    "get_node_info": _get_node_info,
+    "list_services": _list_services,
+    "get_service_info": _get_service_info,
+    "call_service": _call_service,
+    "get_param": _get_param,
+    "set_param": _set_param,
+    "list_params": _list_params,
+    "list_all": _list_all,
+    "subscribe_topic": _subscribe_topic,
+}
+
+# Arguments are checked against _VALIDATORS, so skip the SDK's per-call jsonschema.validate
+@app.call_tool(validate_input=False)
 async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
+    arguments = arguments or {}
     try:
-        if name == "list_topics":
-            topics = ros.get_topics()
-            return [types.TextContent(type="text", text=f"Available topics: {topics}")]
-        
-        elif name == "get_topic_info":
-            topic_name = arguments["topic_name"]
-            topic_type = ros.get_topic_type(topic_name)
-            return [types.TextContent(type="text", text=f"Topic {topic_name} type: {topic_type}")]
-        
-        elif name == "publish_message":
-            topic_name = arguments["topic_name"]
-            message_type = arguments["message_type"]
-            message_data = arguments["message_data"]
-            
-            publisher = roslibpy.Topic(ros, topic_name, message_type)
-            publisher.publish(roslibpy.Message(message_data))
-            return [types.TextContent(type="text", text=f"Published message to {topic_name}")]
-        
-        elif name == "list_nodes":
-            nodes = ros.get_nodes()
-            return [types.TextContent(type="text", text=f"Available nodes: {nodes}")]
-        
-        elif name == "get_node_info":
-            node_name = arguments["node_name"]
-            # Get node info (publications, subscriptions, services)
-            node_details = ros.get_node_details(node_name)
-            return [types.TextContent(type="text", text=f"Node {node_name} details: {node_details}")]
-        
-        elif name == "list_services":
-            services = ros.get_services()
-            return [types.TextContent(type="text", text=f"Available services: {services}")]
-        
-        elif name == "get_service_info":
-            service_name = arguments["service_name"]
-            service_type = ros.get_service_type(service_name)
-            return [types.TextContent(type="text", text=f"Service {service_name} type: {service_type}")]
-        
-        elif name == "call_service":
-            service_name = arguments["service_name"]
-            service_type = arguments["service_type"]
-            service_args = arguments["service_args"]
-            
-            service = roslibpy.Service(ros, service_name, service_type)
-            request = roslibpy.ServiceRequest(service_args)
-            result = service.call(request)
-            return [types.TextContent(type="text", text=f"Service call result: {result}")]
-        
-        elif name == "get_param":
-            param_name = arguments["param_name"]
-            param = roslibpy.Param(ros, param_name)
-            value = param.get()
-            return [types.TextContent(type="text", text=f"Parameter {param_name} value: {value}")]
-        
-        elif name == "set_param":
-            param_name = arguments["param_name"]
-            param_value = arguments["param_value"]
-            param = roslibpy.Param(ros, param_name)
-            param.set(param_value)
-            return [types.TextContent(type="text", text=f"Set parameter {param_name} to {param_value}")]
-        
-        elif name == "list_params":
-            params = ros.get_params()
-            return [types.TextContent(type="text", text=f"Available parameters: {params}")]
-        
-        elif name == "subscribe_topic":
-            topic_name = arguments["topic_name"]
-            timeout = arguments.get("timeout", 5.0)
-            
-            messages = []
-            listener = roslibpy.Topic(ros, topic_name)
-            
-            def message_callback(message):
-                messages.append(message)
-            
-            listener.subscribe(message_callback)
-            
-            # Wait for messages
-            await asyncio.sleep(timeout)
-            listener.unsubscribe()
-            
-            if messages:
-                return [types.TextContent(type="text", text=f"Received {len(messages)} messages from {topic_name}: {messages[-5:]}")]  # Last 5 messages
-            else:
-                return [types.TextContent(type="text", text=f"No messages received from {topic_name} within {timeout} seconds")]
-    
+        _VALIDATORS[name].validate(arguments)
+    except ValidationError as e:
+        return [types.TextContent(type="text", text=f"Invalid arguments for {name}: {e.message}")]
+    gate = _SUBSCRIBE_SEM if name == "subscribe_topic" else _SEM
+    try:
+        async with gate:
+            return await handler(arguments)
+    except asyncio.TimeoutError as e:
+        return [types.TextContent(type="text", text=f"Timed out executing {name}: {str(e)}")]
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error executing {name}: {str(e)}")]
 
+def _tune_socket():
+    # Disable Nagle so small rosbridge requests go out immediately, and enable
+    # keepalive so a dead rosbridge is noticed. This reaches into roslibpy's
+    # Twisted transport, which isn't public API, so failures are ignored.
+    try:
+        sock = ros.factory._proto.transport.getHandle()
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except (AttributeError, OSError):
+        pass
+
 async def main():
-    ros.run()
+    # roslibpy's Twisted factory reconnects on its own after rosbridge drops; cap its
+    # backoff (Twisted's default grows to an hour) and re-tune every new socket.
+    ros.factory.set_initial_delay(1)
+    ros.factory.set_max_delay(30)
+    ros.on("ready", lambda *_: _tune_socket())
+    try:
+        await _run_blocking(ros.run)
+    except Exception as e:
+        # Keep serving; tools report errors until the factory's retries connect
+        print(f"[ROS] Initial connection failed, retrying in the background: {e}", file=sys.stderr)
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await app.run(
             read_stream,